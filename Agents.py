@@ -1,6 +1,8 @@
 import random
-from copy import deepcopy
-from GoBoard import GoBoard
+
+import numpy as np
+
+from GoBoard import GoBoard, COLOR_CODES, EMPTY
 
 
 class Agent:
@@ -8,6 +10,8 @@ class Agent:
     Base class for an agent that plays the game of Go. This class provides a common interface 
     for various types of agents, such as random or greedy agents.
     """
+    __slots__ = ('color',)
+
     def __init__(self, color):
         """
         Initializes the agent with a specified color (either 'BLACK' or 'WHITE').
@@ -35,6 +39,8 @@ class RandomAgent(Agent):
     """
     An agent that selects a random legal move from the available legal moves on the board.
     """
+    __slots__ = ()
+
     def __init__(self, color):
         """
         Initializes the RandomAgent with a specified color (either 'BLACK' or 'WHITE').
@@ -63,6 +69,8 @@ class GreedyAgent(Agent):
     An agent that selects a move based on a heuristic function. The GreedyAgent evaluates all legal
     moves and picks the one that maximizes the heuristic score.
     """
+    __slots__ = ()
+
     def __init__(self, color):
         """
         Initializes the GreedyAgent with a specified color and heuristic function.
@@ -74,6 +82,31 @@ class GreedyAgent(Agent):
         """
         super().__init__(color)
 
+    def _score(self, board):
+        """
+        Evaluate the board for this agent's color with the same weights as
+        GoBoard.evaluate_board_using_heuristic2, but with the stone-count and
+        liberty terms computed as whole-board NumPy reductions instead of
+        per-cell Python loops. The liberty term of the original is the number
+        of adjacent (own stone, empty cell) pairs, which four shifted mask
+        intersections count exactly; the territory term keeps the board's
+        flood-fill, whose result depends on its scan order.
+
+        Args:
+            board (GoBoard): The board to score.
+
+        Returns:
+            int: The heuristic score for this agent's color.
+        """
+        code = COLOR_CODES[self.color]
+        cells = np.frombuffer(board.board, dtype=np.uint8).reshape(board.size, board.size)
+        stones = cells == code
+        empty = cells == EMPTY
+        liberties = int((stones[1:, :] & empty[:-1, :]).sum() + (stones[:-1, :] & empty[1:, :]).sum()
+                        + (stones[:, 1:] & empty[:, :-1]).sum() + (stones[:, :-1] & empty[:, 1:]).sum())
+        return (int(stones.sum()) + board.controlled_territory(self.color) * 5
+                + board.get_captures(self.color) * 3 + liberties * 2)
+
     def getAction(self, board):
         """
         Selects the best legal move based on the provided heuristic function. The agent simulates
@@ -91,11 +124,11 @@ class GreedyAgent(Agent):
 
         for action in legal_moves:
             x, y = action
-            # Simulate the move
-            board_copy = deepcopy(board)
-            if board_copy.play_move(x, y, self.color):
-                # Evaluate the board using the heuristic
-                score = board_copy.evaluate_board_using_heuristic2(self.color)
+            # Simulate the move in place and undo it afterwards
+            if board.play_move(x, y, self.color, record_history=True):
+                # Evaluate the board using the vectorized heuristic
+                score = self._score(board)
+                board.undo_move()
                 if score > best_score:
                     best_score = score
                     best_actions = [action]
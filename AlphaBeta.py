@@ -1,84 +1,309 @@
+import multiprocessing
+import time
 from typing import Tuple, Optional, Dict
 
+from GoBoard import COLOR_CODES, EMPTY
+
+# Transposition table entry flags: is the stored value exact, or only a bound
+# produced by an alpha/beta cutoff?
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+def _evaluate_root_move(args):
+    """
+    Worker for alphabeta_parallel: search a single root move serially in a
+    separate process and return (move, value). The alpha bound established by
+    the eldest brother is passed by value, so workers prune against it but
+    cannot tighten it for each other (the usual Young-Brothers-Wait tradeoff).
+    """
+    board, color, move, depth, alpha = args
+    searcher = AlphaBeta(board, color)
+    board_copy = board.copy()
+    board_copy.play_move(*move, color)
+    value = searcher._alphabeta_search(board_copy, board.opponent_color(color), depth - 1, alpha, float('inf'), False)
+    return move, value
+
 
 class AlphaBeta:
+    __slots__ = ('board', 'color', '_tt', '_tt_age', '_moves_cache')
+
     def __init__(self, board, color: str):
         self.board = board
         self.color = color
-        self.memo: Dict[str, float] = {}  # Memoization dictionary
+        # Fixed-size transposition table indexed by the position hash; each slot
+        # holds a (hash, color, depth, value, flag, best_move, age) tuple or None.
+        # Bounded memory, unlike a dict that grows for the whole game.
+        self._tt = [None] * self._TT_SIZE
+        self._tt_age = 0
+        # Legal-move lists keyed by (zobrist_hash, color): positions reached
+        # through transpositions reuse the generated moves instead of re-running
+        # the per-cell legality simulation.
+        self._moves_cache: Dict[Tuple[int, str], Tuple[Tuple[int, int], ...]] = {}
 
-    def alphabeta(self, depth: int, alpha: float, beta: float, maximizing: bool) -> Tuple[Optional[Tuple[int, int]], float]:
+    _MOVES_CACHE_LIMIT = 200000
+    _TT_SIZE = 1 << 18
+    _TT_MASK = _TT_SIZE - 1
+
+    def _tt_probe(self, board_hash: int, color: str):
         """
-        Perform Alpha-Beta pruning to find the best move and its value.
+        Return the stored (hash, color, depth, value, flag, best_move, age)
+        entry for this exact position, or None on a miss or slot collision.
+        """
+        entry = self._tt[hash((board_hash, color)) & self._TT_MASK]
+        if entry is not None and entry[0] == board_hash and entry[1] == color:
+            return entry
+        return None
+
+    def _tt_store(self, board_hash: int, color: str, depth: int, value: float, flag: int,
+                  best_move: Optional[Tuple[int, int]]):
+        """
+        Store a search result, overwriting the slot's current occupant only if
+        it is empty, from an older root search, or searched no deeper than the
+        new entry (replace-if-deeper).
         """
-        best_move = None
-        best_value = -float('inf') if maximizing else float('inf')
-
-        for move in self.board.get_legal_moves(self.color):
-            board_copy = self.board.copy()
-            board_copy.play_move(*move, self.color)
-            move_value = self._alphabeta_search(board_copy, self.board.opponent_color(self.color), depth - 1, alpha, beta, not maximizing)
-            if maximizing:
-                if move_value > best_value:
-                    best_value = move_value
-                    best_move = move
-                alpha = max(alpha, best_value)
-            else:
-                if move_value < best_value:
-                    best_value = move_value
-                    best_move = move
-                beta = min(beta, best_value)
-
-            if beta <= alpha:
-                break  # Beta cut-off
+        slot = hash((board_hash, color)) & self._TT_MASK
+        entry = self._tt[slot]
+        if entry is None or entry[6] < self._tt_age or depth >= entry[2]:
+            self._tt[slot] = (board_hash, color, depth, value, flag, best_move, self._tt_age)
+
+    def _legal_moves(self, board, color: str):
+        """
+        Return board.get_legal_moves(color) as a fresh list, memoized on the
+        position hash. The cache stores tuples so cached entries are immune to
+        the in-place sorting done by _order_moves.
+        """
+        key = (board.zobrist_hash, color)
+        cached = self._moves_cache.get(key)
+        if cached is None:
+            cached = tuple(board.get_legal_moves(color))
+            if len(self._moves_cache) >= self._MOVES_CACHE_LIMIT:
+                self._moves_cache.pop(next(iter(self._moves_cache)))
+            self._moves_cache[key] = cached
+        return list(cached)
+
+    def iterative_alphabeta(self, max_depth: int, time_limit: Optional[float] = None) -> Tuple[Optional[Tuple[int, int]], float]:
+        """
+        Run alphabeta at increasing depths 1..max_depth, returning the result of the
+        deepest completed iteration. The transposition table is kept between
+        iterations, so each shallow pass seeds the move ordering of the next one;
+        an optional time_limit (seconds) makes the search anytime.
+        """
+        start = time.time()
+        best_move, best_value = None, -float('inf')
+        for depth in range(1, max_depth + 1):
+            best_move, best_value = self.alphabeta(depth, -float('inf'), float('inf'), True)
+            if time_limit is not None and time.time() - start >= time_limit:
+                break
+        return best_move, best_value
+
+    def alphabeta_parallel(self, depth: int, processes: Optional[int] = None) -> Tuple[Optional[Tuple[int, int]], float]:
+        """
+        Young-Brothers-Wait parallelization of the root: the first (best ordered)
+        move is searched serially to establish a real alpha bound, then the
+        remaining root moves are dispatched to a multiprocessing pool, each worker
+        running the serial search with that bound.
+        """
+        moves = self._legal_moves(self.board, self.color)
+        if not moves:
+            return None, -float('inf')
+        self._order_moves(self.board, moves, self.color)
+
+        opponent = self.board.opponent_color(self.color)
+        board_copy = self.board.copy()
+        board_copy.play_move(*moves[0], self.color)
+        best_value = self._alphabeta_search(board_copy, opponent, depth - 1, -float('inf'), float('inf'), False)
+        best_move = moves[0]
 
+        if len(moves) > 1:
+            args = [(self.board, self.color, move, depth, best_value) for move in moves[1:]]
+            with multiprocessing.Pool(processes) as pool:
+                for move, value in pool.imap_unordered(_evaluate_root_move, args):
+                    if value > best_value:
+                        best_value = value
+                        best_move = move
         return best_move, best_value
 
+    def alphabeta(self, depth: int, alpha: float, beta: float, maximizing: bool) -> Tuple[Optional[Tuple[int, int]], float]:
+        """
+        Perform Alpha-Beta pruning to find the best move and its value.
+
+        The root is just the first frame of _alphabeta_search, so move
+        ordering, the transposition table and make/unmake apply identically at
+        every ply; the best move is read back from the root's stored TT entry.
+        """
+        self._tt_age += 1
+        value = self._alphabeta_search(self.board.copy(), self.color, depth, alpha, beta, maximizing)
+        entry = self._tt_probe(self.board.zobrist_hash, self.color)
+        best_move = entry[5] if entry is not None else None
+        return best_move, value
+
     def _alphabeta_search(self, board: 'GoBoard', color: str, depth: int, alpha: float, beta: float, maximizing: bool) -> float:
-        board_key = self._board_to_key(board.board)
+        """
+        Iterative principal-variation search driven by an explicit frame stack.
+
+        A single mutable board is walked depth-first with play_move/undo_move
+        instead of copying a board per node, and each frame keeps the per-node
+        loop state (window, move iterator, running best), so no CPython call
+        frames are created per node. After a node's first (principal) child has
+        been searched with the full window, later children are probed with a
+        null window around the tightened bound; a probe whose value lands
+        inside the real window is re-searched with the full window, so values
+        that matter stay exact while refuted moves are dismissed cheaply.
+        """
+        stack = []
+        result = self._open_frame(stack, board, color, depth, alpha, beta, maximizing)
+        while stack:
+            frame = stack[-1]
+            if result is not None:
+                # A child below just finished with value `result`.
+                value = result
+                result = None
+                if frame['scout'] and frame['alpha'] < value < frame['beta']:
+                    # The null-window probe failed high: the move is better
+                    # than the bound after all, so re-search it (still played
+                    # on the board) with the full window for an exact value.
+                    frame['scout'] = False
+                    result = self._open_frame(stack, board, board.opponent_color(frame['color']),
+                                              frame['depth'] - 1, frame['alpha'], frame['beta'],
+                                              not frame['maximizing'])
+                    continue
+                # Unmake the child's move and fold the value into this frame's
+                # running best.
+                if frame['played']:
+                    board.undo_move()
+                    frame['played'] = False
+                if frame['maximizing']:
+                    if value > frame['best_value']:
+                        frame['best_value'] = value
+                        frame['best_move'] = frame['moves'][frame['index'] - 1]
+                    frame['alpha'] = max(frame['alpha'], frame['best_value'])
+                else:
+                    if value < frame['best_value']:
+                        frame['best_value'] = value
+                        frame['best_move'] = frame['moves'][frame['index'] - 1]
+                    frame['beta'] = min(frame['beta'], frame['best_value'])
 
-        # Check memoization
-        if (board_key, color, depth) in self.memo:
-            return self.memo[(board_key, color, depth)]
+            if frame['beta'] <= frame['alpha'] or frame['index'] >= len(frame['moves']):
+                result = self._close_frame(frame)
+                stack.pop()
+                continue
+
+            move = frame['moves'][frame['index']]
+            frame['index'] += 1
+            frame['played'] = board.play_move(*move, frame['color'], record_history=True)
+            child_alpha, child_beta = frame['alpha'], frame['beta']
+            frame['scout'] = False
+            if frame['index'] > 1:
+                # The principal child fixed a bound; probe the rest with a
+                # null window around it. The evaluations are integers, so a
+                # width-1 window is empty.
+                if frame['maximizing']:
+                    if child_alpha > -float('inf'):
+                        child_beta = child_alpha + 1
+                        frame['scout'] = True
+                elif child_beta < float('inf'):
+                    child_alpha = child_beta - 1
+                    frame['scout'] = True
+            result = self._open_frame(stack, board, board.opponent_color(frame['color']),
+                                      frame['depth'] - 1, child_alpha, child_beta,
+                                      not frame['maximizing'])
+        return result
+
+    def _open_frame(self, stack, board: 'GoBoard', color: str, depth: int, alpha: float, beta: float,
+                    maximizing: bool) -> Optional[float]:
+        """
+        Start evaluating a node: probe the transposition table and handle leaf
+        positions directly, returning their value; otherwise push a search frame
+        onto the stack and return None.
+        """
+        board_hash = board.zobrist_hash
+
+        # Probe the transposition table: an entry searched at least as deep as the
+        # current request can be reused, either directly (EXACT) or as a bound.
+        entry = self._tt_probe(board_hash, color)
+        if entry is not None:
+            entry_depth, entry_value, entry_flag = entry[2], entry[3], entry[4]
+            if entry_depth >= depth:
+                if entry_flag == EXACT:
+                    return entry_value
+                if entry_flag == LOWER and entry_value >= beta:
+                    return entry_value
+                if entry_flag == UPPER and entry_value <= alpha:
+                    return entry_value
 
         if depth == 0:
             value = board.evaluate_board_using_heuristic(color)
-            self.memo[(board_key, color, depth)] = value
+            self._tt_store(board_hash, color, depth, value, EXACT, None)
             return value
 
-        moves = board.get_legal_moves(color)
+        moves = self._legal_moves(board, color)
         if not moves:
             value = board.evaluate_board(color)
-            self.memo[(board_key, color, depth)] = value
+            self._tt_store(board_hash, color, depth, value, EXACT, None)
             return value
 
-        if maximizing:
-            best_value = -float('inf')
-            for move in moves:
-                board_copy = board.copy()
-                board_copy.play_move(*move, color)
-                value = self._alphabeta_search(board_copy, board.opponent_color(color), depth - 1, alpha, beta, False)
-                best_value = max(best_value, value)
-                alpha = max(alpha, best_value)
-                if beta <= alpha:
-                    break  # Beta cut-off
-            self.memo[(board_key, color, depth)] = best_value
-            return best_value
+        self._order_moves(board, moves, color, entry[5] if entry is not None else None)
+        stack.append({
+            'key': (board_hash, color),
+            'color': color,
+            'depth': depth,
+            'alpha': alpha,
+            'beta': beta,
+            'alpha_orig': alpha,
+            'beta_orig': beta,
+            'maximizing': maximizing,
+            'moves': moves,
+            'index': 0,
+            'best_value': -float('inf') if maximizing else float('inf'),
+            'best_move': None,
+            'played': False,
+            'scout': False,
+        })
+        return None
+
+    def _close_frame(self, frame) -> float:
+        """
+        Finish a node: classify its value relative to the original window, store
+        the transposition entry and return the value to the parent frame.
+        """
+        best_value = frame['best_value']
+        if best_value <= frame['alpha_orig']:
+            flag = UPPER
+        elif best_value >= frame['beta_orig']:
+            flag = LOWER
         else:
-            best_value = float('inf')
-            for move in moves:
-                board_copy = board.copy()
-                board_copy.play_move(*move, color)
-                value = self._alphabeta_search(board_copy, board.opponent_color(color), depth - 1, alpha, beta, True)
-                best_value = min(best_value, value)
-                beta = min(beta, best_value)
-                if beta <= alpha:
-                    break  # Alpha cut-off
-            self.memo[(board_key, color, depth)] = best_value
-            return best_value
-
-    def _board_to_key(self, board: 'GoBoard') -> str:
-        """
-        Convert the board state to a unique key for memoization.
-        """
-        return str(board)  # A simple board serialization method
+            flag = EXACT
+        board_hash, color = frame['key']
+        self._tt_store(board_hash, color, frame['depth'], best_value, flag, frame['best_move'])
+        return best_value
+
+    def _order_moves(self, board: 'GoBoard', moves, color: str, tt_move: Optional[Tuple[int, int]] = None):
+        """
+        Sort moves in place so that likely cutoffs are searched first: the
+        transposition-table best move, then moves that put opponent groups in
+        atari, then the rest in board-scan order.
+        """
+        if tt_move is None:
+            entry = self._tt_probe(board.zobrist_hash, color)
+            tt_move = entry[5] if entry is not None else None
+        moves.sort(key=lambda move: (move != tt_move, -self._capture_potential(board, move, color)))
+
+    def _capture_potential(self, board: 'GoBoard', move: Tuple[int, int], color: str) -> int:
+        """
+        Count the adjacent opponent groups that are down to a single liberty,
+        i.e. groups this move would capture or threaten directly.
+        """
+        x, y = move
+        idx = x * board.size + y
+        code = COLOR_CODES[color]
+        count = 0
+        seen = set()
+        for ni in board.neighbors_of(idx):
+            neighbor_color = board.board[ni]
+            if neighbor_color != EMPTY and neighbor_color != code:
+                group_id = board.group_index[ni]
+                if group_id not in seen:
+                    seen.add(group_id)
+                    if bin(board.groups[group_id][1]).count('1') == 1:
+                        count += 1
+        return count
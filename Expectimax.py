@@ -1,4 +1,3 @@
-import random
 from typing import Tuple, Optional, Dict
 
 
@@ -8,6 +7,8 @@ class Expectimax:
      and uses an Expectimax search tree to select the optimal move based on the expected value of future game states.
      """
 
+    __slots__ = ('board', 'color', 'memo', '_moves_cache')
+
     def __init__(self, board, color: str):
         """
            Initializes the Expectimax class with the current board state and player color.
@@ -18,9 +19,26 @@ class Expectimax:
            """
         self.board = board
         self.color = color
-        self.memo: Dict[str, float] = {}  # Memoization dictionary
+        self.memo: Dict[Tuple[int, str, int], float] = {}  # Memoization keyed by (zobrist_hash, color, depth)
+        # Legal-move lists keyed by (zobrist_hash, color): positions reached
+        # through transpositions reuse the generated moves instead of re-running
+        # the per-cell legality simulation.
+        self._moves_cache: Dict[Tuple[int, str], Tuple[Tuple[int, int], ...]] = {}
 
+    _MOVES_CACHE_LIMIT = 200000
 
+    def _legal_moves(self, board, color: str):
+        """
+        Return board.get_legal_moves(color), memoized on the position hash.
+        """
+        key = (board.zobrist_hash, color)
+        cached = self._moves_cache.get(key)
+        if cached is None:
+            cached = tuple(board.get_legal_moves(color))
+            if len(self._moves_cache) >= self._MOVES_CACHE_LIMIT:
+                self._moves_cache.pop(next(iter(self._moves_cache)))
+            self._moves_cache[key] = cached
+        return cached
 
     def expectimax(self, depth: int) -> Tuple[Optional[Tuple[int, int]], float]:
         """
@@ -35,7 +53,7 @@ class Expectimax:
         best_move = None
         best_value = -float('inf')
 
-        for move in self.board.get_legal_moves(self.color):
+        for move in self._legal_moves(self.board, self.color):
             board_copy = self.board.copy()
             board_copy.play_move(*move, self.color)
             move_value = self._expectimax_search(board_copy, self.board.opponent_color(self.color), depth - 1)
@@ -45,7 +63,6 @@ class Expectimax:
 
         return best_move, best_value
 
-
     def _expectimax_search(self, board: 'GoBoard', color: str, depth: int) -> float:
         """
         Recursively performs the Expectimax search for a given board state.
@@ -58,20 +75,18 @@ class Expectimax:
         Returns:
             A float representing the expected value of the game state after performing the search.
         """
-        board_key = self._board_to_key(board.board)
+        board_key = board.zobrist_hash
 
         # Check memoization
         if (board_key, color, depth) in self.memo:
             return self.memo[(board_key, color, depth)]
 
         if depth == 0:
-            # value = board.evaluate_board(color)
-            # value = board.evaluate_board_using_heuristic(color)
             value = board.evaluate_board_using_heuristic2(color)
             self.memo[(board_key, color, depth)] = value
             return value
 
-        moves = board.get_legal_moves(color)
+        moves = self._legal_moves(board, color)
         if not moves:
             value = board.evaluate_board(color)
             self.memo[(board_key, color, depth)] = value
@@ -94,17 +109,4 @@ class Expectimax:
                 total_value += self._expectimax_search(board_copy, board.opponent_color(color), depth - 1)
             average_value = total_value / len(moves) if moves else 0
             self.memo[(board_key, color, depth)] = average_value
-            return average_value
-
-
-    def _board_to_key(self, board: 'GoBoard') -> str:
-        """
-         Converts the current board state into a unique string representation for memoization.
-
-         Args:
-             board: The current GoBoard object.
-
-         Returns:
-             A string representing the current board state that can be used as a key in the memoization dictionary.
-         """
-        return str(board)
\ No newline at end of file
+            return average_value
\ No newline at end of file
@@ -1,9 +1,151 @@
 import random
 from typing import Dict, Set, Tuple, List, Optional
-from copy import deepcopy, copy
+
+import numpy as np
+
+from goboard_kernels import flood_group, surrounded_territories, enclosed_areas
+
+# Cell encoding for the flat board buffer.
+EMPTY, BLACK, WHITE = 0, 1, 2
+COLOR_CODES = {'BLACK': BLACK, 'WHITE': WHITE}
+COLOR_NAMES = {BLACK: 'BLACK', WHITE: 'WHITE'}
+OPPONENT = {'BLACK': 'WHITE', 'WHITE': 'BLACK'}
+
+# Zobrist keys per board size: one random 64-bit key per (cell, color code).
+# The empty slot is 0 so an empty board always hashes to 0.
+_zobrist_tables: Dict[int, List[List[int]]] = {}
+
+
+def zobrist_table(size: int) -> List[List[int]]:
+    """
+    Return the Zobrist key table for the given board size, creating it on first use.
+
+    Args:
+        size (int): The size of the Go board.
+
+    Returns:
+        List[List[int]]: A table of shape [size*size][3] where entry [idx][code] is the
+        64-bit key for a stone of that color code on cell idx (the EMPTY column is 0).
+    """
+    table = _zobrist_tables.get(size)
+    if table is None:
+        rng = random.Random(size)
+        table = [[0, rng.getrandbits(64), rng.getrandbits(64)] for _ in range(size * size)]
+        _zobrist_tables[size] = table
+    return table
+
+
+# Bitboard edge masks per board size. Boards are packed into one Python int
+# with bit idx = x * size + y, so a +-1 shift moves along a row and a +-size
+# shift moves along a column; the column masks stop +-1 shifts from wrapping
+# across row boundaries.
+_edge_masks: Dict[int, Tuple[int, int, int]] = {}
+
+
+def edge_masks(size: int) -> Tuple[int, int, int]:
+    """
+    Return (full_mask, not_first_col, not_last_col) bit masks for the given size,
+    creating them on first use.
+    """
+    masks = _edge_masks.get(size)
+    if masks is None:
+        full = (1 << (size * size)) - 1
+        first_col = 0
+        for x in range(size):
+            first_col |= 1 << (x * size)
+        last_col = first_col << (size - 1)
+        masks = (full, full & ~first_col, full & ~last_col)
+        _edge_masks[size] = masks
+    return masks
+
+
+# Neighbor lookup tables per board size: the valid four-neighbors of every
+# cell never change, so they are built once and shared by all boards.
+_neighbor_tables: Dict[int, Tuple[List[Tuple[int, ...]], List[List[Tuple[int, int]]]]] = {}
+
+
+def neighbor_tables(size: int) -> Tuple[List[Tuple[int, ...]], List[List[Tuple[int, int]]]]:
+    """
+    Return (flat, coords) neighbor tables for the given board size, creating
+    them on first use. flat[idx] is a tuple of the valid neighboring flat
+    indices of cell idx; coords[idx] is the same neighborhood as (x, y) pairs.
+    """
+    tables = _neighbor_tables.get(size)
+    if tables is None:
+        flat = []
+        coords = []
+        for x in range(size):
+            for y in range(size):
+                cell_coords = [(nx, ny) for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1))
+                               if 0 <= nx < size and 0 <= ny < size]
+                coords.append(cell_coords)
+                flat.append(tuple(nx * size + ny for nx, ny in cell_coords))
+        tables = (flat, coords)
+        _neighbor_tables[size] = tables
+    return tables
+
+
+# Border bitboard masks per board size: one bit per first/last row or column
+# cell, covering every corner and edge point.
+_border_masks: Dict[int, int] = {}
+
+
+def border_mask(size: int) -> int:
+    """
+    Return the bitboard of all corner and edge cells for the given board size,
+    creating it on first use.
+    """
+    mask = _border_masks.get(size)
+    if mask is None:
+        mask = 0
+        for x in range(size):
+            for y in range(size):
+                if x in (0, size - 1) or y in (0, size - 1):
+                    mask |= 1 << (x * size + y)
+        _border_masks[size] = mask
+    return mask
+
+
+# Move-coordinate tables per board size: only size*size (x, y) pairs exist,
+# so move generation hands out these shared tuples instead of allocating a
+# fresh pair per call.
+_move_tables: Dict[int, Tuple[Tuple[int, int], ...]] = {}
+
+
+def move_table(size: int) -> Tuple[Tuple[int, int], ...]:
+    """
+    Return the flat-index-to-(x, y) coordinate table for the given board size,
+    creating it on first use.
+    """
+    table = _move_tables.get(size)
+    if table is None:
+        table = tuple((idx // size, idx % size) for idx in range(size * size))
+        _move_tables[size] = table
+    return table
+
+
+def bits_to_indices(bb: int) -> List[int]:
+    """
+    Unpack a bitboard into the list of flat cell indices of its set bits.
+    """
+    indices = []
+    while bb:
+        lsb = bb & -bb
+        indices.append(lsb.bit_length() - 1)
+        bb ^= lsb
+    return indices
 
 
 class GoBoard:
+    # Fixed attribute slots: search allocates thousands of board copies, and
+    # dropping the per-instance __dict__ shrinks each one and speeds up
+    # attribute access.
+    __slots__ = ('size', 'board', 'captured', 'previous_boards', 'last_captured', 'history',
+                 'zobrist', 'zobrist_hash', '_scratch', '_full_mask', '_not_first_col',
+                 '_not_last_col', '_neighbors', '_neighbor_coords', 'black_bb', 'white_bb',
+                 'groups', 'group_index', '_areas_cache', '_territory_cache', '_border_mask',
+                 '_moves', '_last_capture')
+
     def __init__(self, size: int, previous_boards):
         """
         Initializes a GoBoard instance with a given size and a list of previous board states.
@@ -13,16 +155,41 @@ class GoBoard:
         previous_boards (list): A list of previous board configurations to detect repetitions (ko).
 
         Attributes:
-        board (list): A 2D list representing the current state of the Go board, where each position can be None, 'BLACK', or 'WHITE'.
+        board (bytearray): A flat buffer of size*size cells representing the current state of the
+        Go board, where each cell is EMPTY (0), BLACK (1) or WHITE (2) and cell (x, y) lives at
+        index x * size + y.
         captured (dict): Tracks the number of stones captured by 'BLACK' and 'WHITE' players.
-        previous_boards (list): Stores previous board states to help detect ko.
-        last_captured (dict): Keeps track of the most recent capture made by each player.
+        previous_boards (set): Stores the Zobrist hashes of previous board states to help detect ko.
+        last_captured (dict): The stones bitboard of the group most recently captured by each
+        player, used by the ko-related check in is_legal_move.
+        history (list): Snapshots of (board, captured, hash, bitboards, groups) taken before each successful move, used by undo_move.
+        zobrist_hash (int): Incrementally maintained 64-bit Zobrist hash of the board position.
+        black_bb / white_bb (int): Occupancy bitboards with bit x * size + y set per stone, kept in sync with the buffer.
+        groups (dict): Maps a group id to its (stones, liberties) bitboard pair, updated
+        incrementally as moves merge groups and fill or free liberties, so the play path
+        never re-floods a group.
+        group_index (list): Maps each flat cell index to the id of the group occupying it, or -1.
         """
         self.size = size
-        self.board = [[None for _ in range(size)] for _ in range(size)]
+        self.board = bytearray(size * size)
         self.captured = {'BLACK': 0, 'WHITE': 0}
         self.previous_boards = previous_boards
         self.last_captured = {'BLACK': None, 'WHITE': None}
+        self.history = []
+        self.zobrist = zobrist_table(size)
+        self.zobrist_hash = 0
+        self._scratch = np.empty(size * size, np.int32)
+        self._full_mask, self._not_first_col, self._not_last_col = edge_masks(size)
+        self._neighbors, self._neighbor_coords = neighbor_tables(size)
+        self._border_mask = border_mask(size)
+        self._moves = move_table(size)
+        self.black_bb = 0
+        self.white_bb = 0
+        self.groups = {}
+        self.group_index = [-1] * (size * size)
+        self._areas_cache = None
+        self._territory_cache = None
+        self._last_capture = 0
 
     def is_on_board(self, x: int, y: int) -> bool:
         """
@@ -48,66 +215,214 @@ class GoBoard:
         Returns:
         List[Tuple[int, int]]: A list of valid neighboring coordinates.
         """
-        neighbors = [(x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)]
-        return [(nx, ny) for nx, ny in neighbors if self.is_on_board(nx, ny)]
+        return self._neighbor_coords[x * self.size + y]
+
+    def neighbors_of(self, idx: int) -> Tuple[int, ...]:
+        """
+        Retrieves the valid neighboring flat indices for a given cell index
+        from the precomputed per-size table.
+
+        Args:
+        idx (int): The flat index of the cell (x * size + y).
+
+        Returns:
+        Tuple[int, ...]: The valid neighboring flat indices.
+        """
+        return self._neighbors[idx]
 
-    def get_group(self, x: int, y: int, board: Optional[List[List[Optional[str]]]] = None) -> Set[Tuple[int, int]]:
+    def expand_bb(self, bb: int) -> int:
+        """
+        Return the bitboard of all four-neighbors of the cells set in bb, using
+        masked shifts so no per-cell bounds checks are needed.
+        """
+        return ((bb << self.size) | (bb >> self.size)
+                | ((bb << 1) & self._not_first_col)
+                | ((bb >> 1) & self._not_last_col)) & self._full_mask
+
+    def group_bb(self, idx: int) -> int:
+        """
+        Return the bitboard of the group of stones connected to the given flat
+        index, computed by expanding the seed bit to a fixed point within the
+        same-color bitboard.
+        """
+        color_bb = self.black_bb if self.board[idx] == BLACK else self.white_bb
+        group = 1 << idx
+        while True:
+            grown = group | (self.expand_bb(group) & color_bb)
+            if grown == group:
+                return group
+            group = grown
+
+    def group_has_liberty(self, group: int) -> bool:
+        """
+        Check whether any cell adjacent to the given group bitboard is empty.
+        """
+        empties = self._full_mask & ~(self.black_bb | self.white_bb)
+        return (self.expand_bb(group) & empties) != 0
+
+    def get_group(self, x: int, y: int, board: Optional[bytearray] = None) -> Set[int]:
         """
         Finds all stones connected to the given stone (i.e., the group of connected stones).
 
         Args:
         x (int): The x-coordinate of the starting stone.
         y (int): The y-coordinate of the starting stone.
-        board (Optional[List[List[Optional[str]]]]): Optionally pass a different board to check the group on.
+        board (Optional[bytearray]): Optionally pass a different board buffer to check the group on.
         If not provided, the current board is used.
 
         Returns:
-        Set[Tuple[int, int]]: A set of coordinates representing the stones in the same group.
+        Set[int]: A set of flat indices representing the stones in the same group.
         """
         board = board or self.board
-        color = board[x][y]
-        group = set()
-        stack = [(x, y)]
-        while stack:
-            cx, cy = stack.pop()
-            if (cx, cy) not in group:
-                group.add((cx, cy))
-                for nx, ny in self.get_neighbors(cx, cy):
-                    if board[nx][ny] == color and (nx, ny) not in group:
-                        stack.append((nx, ny))
-        return group
-
-    def has_liberties(self, group: Set[Tuple[int, int]], board: Optional[List[List[Optional[str]]]] = None) -> bool:
+        cells = np.frombuffer(board, dtype=np.uint8)
+        n = flood_group(cells, self.size, x * self.size + y, self._scratch)
+        return set(self._scratch[:n].tolist())
+
+    def has_liberties(self, group: Set[int], board: Optional[bytearray] = None) -> bool:
         """
         Checks if a group of stones has at least one liberty (empty adjacent position).
 
         Args:
-        group (Set[Tuple[int, int]]): A set of coordinates representing a group of connected stones.
-        board (Optional[List[List[Optional[str]]]]): Optionally pass a different board to check on. If not provided, the current board is used.
+        group (Set[int]): A set of flat indices representing a group of connected stones.
+        board (Optional[bytearray]): Optionally pass a different board buffer to check on. If not provided, the current board is used.
 
         Returns:
         bool: True if the group has at least one liberty, False otherwise.
         """
         board = board or self.board
-        for x, y in group:
-            for nx, ny in self.get_neighbors(x, y):
-                if board[nx][ny] is None:
-                    return True
-        return False
+        neighbors = self._neighbors
+        return any(board[ni] == EMPTY for idx in group for ni in neighbors[idx])
 
-    def remove_group(self, group: Set[Tuple[int, int]], color: str):
+    def remove_group(self, group: Set[int], color: int):
         """
         Removes a group of stones from the board and updates the captured stones count for the opposing player.
 
         Args:
-        group (Set[Tuple[int, int]]): A set of coordinates representing a group of connected stones to be removed.
-        color (str): The color of the stones being removed (either 'BLACK' or 'WHITE').
+        group (Set[int]): A set of flat indices representing a group of connected stones to be removed.
+        color (int): The color code of the stones being removed (BLACK or WHITE).
+        """
+        for idx in group:
+            self.board[idx] = EMPTY
+            self.zobrist_hash ^= self.zobrist[idx][color]
+            if color == BLACK:
+                self.black_bb &= ~(1 << idx)
+            else:
+                self.white_bb &= ~(1 << idx)
+        self.captured[COLOR_NAMES[color]] += len(group)
+
+    def _snapshot(self):
         """
-        for x, y in group:
-            self.board[x][y] = None
-        self.captured[color] += len(group)
+        Capture the mutable move state (board buffer, captured counters, hash,
+        bitboards and group records) so a move can be reverted exactly.
+        """
+        return (self.board[:], self.captured.copy(), self.zobrist_hash,
+                (self.black_bb, self.white_bb), dict(self.groups), self.group_index[:])
 
-    def play_move(self, x: int, y: int, color: str) -> bool:
+    def _restore(self, snapshot):
+        """
+        Restore the move state captured by _snapshot.
+        """
+        board_copy, captured_before, hash_before, bbs_before, groups_before, index_before = snapshot
+        self.board = board_copy
+        self.captured = captured_before
+        self.zobrist_hash = hash_before
+        self.black_bb, self.white_bb = bbs_before
+        self.groups = groups_before
+        self.group_index = index_before
+
+    def _apply_stone(self, idx: int, code: int) -> Optional[Set[int]]:
+        """
+        Place a stone and update the incremental group records: same-color
+        neighbor groups are merged with the new stone, opponent groups lose the
+        placed cell from their liberty sets, and any opponent group whose
+        liberties drop to zero is captured. No flood-fill is performed; every
+        update is a bitboard merge or mask on the stored (stones, liberties)
+        pairs. Suicide is detected from the stored liberty sets before anything
+        is mutated, so no state has to be reverted for a rejected move.
+
+        Args:
+            idx (int): Flat index of the cell to play on.
+            code (int): Color code of the stone being placed.
+
+        Returns:
+            Optional[Set[int]]: The set of captured flat indices (possibly empty),
+            or None if the move is suicide (in which case nothing was changed).
+        """
+        stone_bb = 1 << idx
+        same_ids = set()
+        # Opponent groups are kept in neighbor-scan order so that when one
+        # move captures several groups, the group recorded as the most
+        # recently captured is well defined.
+        opponent_ids = []
+        merged_libs = 0
+        for ni in self._neighbors[idx]:
+            neighbor_color = self.board[ni]
+            if neighbor_color == EMPTY:
+                merged_libs |= 1 << ni
+            elif neighbor_color == code:
+                same_ids.add(self.group_index[ni])
+            else:
+                gid = self.group_index[ni]
+                if gid not in opponent_ids:
+                    opponent_ids.append(gid)
+
+        # Suicide pre-check: with no empty neighbor, the move is only playable
+        # if it captures (an adjacent opponent group's last liberty is this
+        # cell) or connects to a friendly group with another liberty left.
+        if merged_libs == 0:
+            captures = any(self.groups[gid][1] == stone_bb for gid in opponent_ids)
+            if not captures and not any(self.groups[gid][1] & ~stone_bb for gid in same_ids):
+                return None
+
+        self.board[idx] = code
+        self.zobrist_hash ^= self.zobrist[idx][code]
+        if code == BLACK:
+            self.black_bb |= stone_bb
+        else:
+            self.white_bb |= stone_bb
+
+        # Merge the placed stone with its same-color neighbor groups.
+        merged_stones = stone_bb
+        for gid in same_ids:
+            stones, libs = self.groups.pop(gid)
+            merged_stones |= stones
+            merged_libs |= libs
+        merged_libs &= ~stone_bb
+
+        # The placed cell is no longer a liberty of adjacent opponent groups;
+        # any of them left without liberties is captured.
+        removed_bb = 0
+        removed = set()
+        for gid in opponent_ids:
+            stones, libs = self.groups[gid]
+            libs &= ~stone_bb
+            if libs == 0:
+                del self.groups[gid]
+                removed_bb |= stones
+                self._last_capture = stones
+            else:
+                self.groups[gid] = (stones, libs)
+        if removed_bb:
+            removed = set(bits_to_indices(removed_bb))
+            self.remove_group(removed, BLACK if code == WHITE else WHITE)
+            for ci in removed:
+                self.group_index[ci] = -1
+
+        new_id = (merged_stones & -merged_stones).bit_length() - 1
+        self.groups[new_id] = (merged_stones, merged_libs)
+        for ci in bits_to_indices(merged_stones):
+            self.group_index[ci] = new_id
+
+        # Captured cells are empty again: hand them back as liberties to every
+        # group they touch, including the group just played.
+        if removed_bb:
+            for gid, (stones, libs) in self.groups.items():
+                adjacent = self.expand_bb(stones) & removed_bb
+                if adjacent:
+                    self.groups[gid] = (stones, libs | adjacent)
+        return removed
+
+    def play_move(self, x: int, y: int, color: str, record_history: bool = False) -> bool:
         """
         Attempt to play a move for the given color at position (x, y).
 
@@ -115,37 +430,35 @@ class GoBoard:
             x (int): The x-coordinate of the move.
             y (int): The y-coordinate of the move.
             color (str): The color of the stone to place ('BLACK' or 'WHITE').
+            record_history (bool): Take an undo snapshot before playing. Only
+            callers that pair the move with undo_move need this; search code
+            that branches on board copies leaves it off and skips the snapshot.
 
         Returns:
             bool: True if the move is valid and successfully played, False otherwise.
 
         This function first checks if the move is valid (on the board and not already occupied).
-        Then it simulates placing the stone and checks for any neighboring stones of the opposite color
-        to see if any group can be captured (no liberties). If no captures occur, it checks if the group
-        formed by the placed stone has any liberties. If the group has no liberties, the move is reverted.
+        Then it places the stone, applying the incremental capture and suicide logic of
+        _apply_stone; a suicide move is rejected without touching the board.
         """
-        if not self.is_on_board(x, y) or self.board[x][y] is not None:
+        idx = x * self.size + y
+        if not self.is_on_board(x, y) or self.board[idx] != EMPTY:
             return False
 
-        board_copy = [row.copy() for row in self.board]
-        captured_before = self.captured.copy()
-        self.board[x][y] = color
-
-        captured_any = False
-        for nx, ny in self.get_neighbors(x, y):
-            neighbor_color = self.board[nx][ny]
-            if neighbor_color is not None and neighbor_color != color:
-                neighbor_group = self.get_group(nx, ny)
-                if not self.has_liberties(neighbor_group):
-                    self.remove_group(neighbor_group, neighbor_color)
-                    captured_any = True
-
-        if not captured_any and not self.has_liberties(self.get_group(x, y)):
-            self.board = board_copy
-            self.captured = captured_before
-            return False
+        if record_history:
+            snapshot = self._snapshot()
+            if self._apply_stone(idx, COLOR_CODES[color]) is None:
+                return False
+            self.history.append(snapshot)
+            return True
+        return self._apply_stone(idx, COLOR_CODES[color]) is not None
 
-        return True
+    def undo_move(self):
+        """
+        Revert the most recent successful play_move, restoring the board and the captured
+        stones count from the snapshot taken before the move was played.
+        """
+        self._restore(self.history.pop())
 
     def play_actual_move(self, x: int, y: int, color: str) -> bool:
         """
@@ -161,48 +474,39 @@ class GoBoard:
 
         This function also tracks the last captured group for future Ko-rule checks.
         """
-        if not self.is_on_board(x, y) or self.board[x][y] is not None:
+        idx = x * self.size + y
+        if not self.is_on_board(x, y) or self.board[idx] != EMPTY:
             return False
 
-        board_copy = [row.copy() for row in self.board]
-        captured_before = self.captured.copy()
-        self.board[x][y] = color
-
-        captured_any = False
-        for nx, ny in self.get_neighbors(x, y):
-            neighbor_color = self.board[nx][ny]
-            if neighbor_color is not None and neighbor_color != color:
-                neighbor_group = self.get_group(nx, ny)
-                if not self.has_liberties(neighbor_group):
-                    self.remove_group(neighbor_group, neighbor_color)
-                    captured_any = True
-                    self.last_captured[color] = neighbor_group
-
-        if not captured_any and not self.has_liberties(self.get_group(x, y)):
-            self.board = board_copy
-            self.captured = captured_before
+        removed = self._apply_stone(idx, COLOR_CODES[color])
+        if removed is None:
             return False
 
+        if removed:
+            # Only the single most recently captured group is recorded, not
+            # the union of everything the move removed: the ko-related check
+            # in is_legal_move compares individual groups against it.
+            self.last_captured[color] = self._last_capture
         return True
 
-    def is_surrounded(self, group: Set[Tuple[int, int]], color: str) -> bool:
+    def is_surrounded(self, group: Set[int], color: str) -> bool:
         """
         Check if all empty spaces in the given group are fully surrounded by the specified color.
 
         Args:
-            group (Set[Tuple[int, int]]): The group of empty spaces to check.
+            group (Set[int]): The group of empty spaces (flat indices) to check.
             color (str): The color that should be surrounding the empty group.
 
         Returns:
             bool: True if all empty spaces in the group are surrounded by stones of the given color, False otherwise.
         """
-        for x, y in group:
-            for nx, ny in self.get_neighbors(x, y):
-                if self.board[nx][ny] == None:
-                    return False  # Found an adjacent empty space
-                elif self.board[nx][ny] != color:
-                    return False  # Found an adjacent stone that is not the specified color
-        return True  # All adjacent stones are of the specified color and no empty spaces are adjacent
+        color_bb = self.black_bb if color == 'BLACK' else self.white_bb
+        group_bb = 0
+        for idx in group:
+            group_bb |= 1 << idx
+        # Every neighbor of every group cell must be a stone of the given
+        # color: one masked-shift expansion tests all of them at once.
+        return self.expand_bb(group_bb) & ~color_bb == 0
 
     def is_legal_move(self, x: int, y: int, color: str) -> bool:
         """
@@ -216,34 +520,48 @@ class GoBoard:
         Returns:
             bool: True if the move is legal, False otherwise.
         """
-        if self.board[x][y] is not None:
+        idx = x * self.size + y
+        if self.board[idx] != EMPTY:
             return False
 
-        board_copy = self.copy()
-        board_copy.board[x][y] = color
-        # Ko rule: check if this move reverts the board to a previous state
-        if tuple(map(tuple, board_copy.board)) in self.previous_boards:
+        code = COLOR_CODES[color]
+        stone_bb = 1 << idx
+        hash_after = self.zobrist_hash ^ self.zobrist[idx][code]
+        # Ko rule: check if this move reverts the board to a previous state.
+        # previous_boards holds Zobrist hashes, so the test is one set lookup
+        # on the incrementally maintained hash instead of a board comparison.
+        if hash_after in self.previous_boards:
             return False
 
-        # Check if move results in a capture or if it has liberties
-        for nx, ny in self.get_neighbors(x, y):
-            neighbor_color = board_copy.board[nx][ny]
-            if neighbor_color is not None and neighbor_color != color:
-                neighbor_group = self.get_group(nx, ny, board_copy.board)
+        last_bb = self.last_captured[color]
+        # Check if move results in a capture or if it has liberties. The
+        # incremental group records answer both without simulating the move on
+        # a board copy: this cell is an opponent group's last liberty exactly
+        # when its stored liberty set is the single placed-stone bit.
+        for ni in self._neighbors[idx]:
+            neighbor_color = self.board[ni]
+            if neighbor_color != EMPTY and neighbor_color != code:
+                stones, libs = self.groups[self.group_index[ni]]
                 # check:
-                if neighbor_group == self.last_captured[color]:
+                if stones == last_bb:
                     return False
-                if not self.has_liberties(neighbor_group, board_copy.board):
-                    board_copy.remove_group(neighbor_group, neighbor_color)
-                    if tuple(map(tuple, board_copy.board)) in self.previous_boards:
+                if libs == stone_bb:
+                    capture_hash = hash_after
+                    for gi in bits_to_indices(stones):
+                        capture_hash ^= self.zobrist[gi][neighbor_color]
+                    if capture_hash in self.previous_boards:
                         return False
                     return True
 
-        player_group = self.get_group(x, y, board_copy.board)
-        if not self.has_liberties(player_group, board_copy.board):
-            return False
-
-        return True
+        # No capture: the stone needs a liberty of its own, either an empty
+        # neighbor or a friendly neighbor group with a liberty besides this cell.
+        for ni in self._neighbors[idx]:
+            neighbor_color = self.board[ni]
+            if neighbor_color == EMPTY:
+                return True
+            if neighbor_color == code and self.groups[self.group_index[ni]][1] & ~stone_bb:
+                return True
+        return False
 
     def get_legal_moves(self, color: str) -> List[Tuple[int, int]]:
         """
@@ -255,12 +573,17 @@ class GoBoard:
         Returns:
             List[Tuple[int, int]]: A list of coordinates where legal moves can be made.
         """
-        return [
-            (x, y)
-            for x in range(self.size)
-            for y in range(self.size)
-            if self.board[x][y] is None and self.is_legal_move(x, y, color)
-        ]
+        # The empty cells are read off the maintained color bitboards instead
+        # of scanning the board buffer; bits unpack in ascending index order,
+        # so the move list keeps its board-scan ordering.
+        moves_table = self._moves
+        empties = ~(self.black_bb | self.white_bb) & self._full_mask
+        moves = []
+        for idx in bits_to_indices(empties):
+            move = moves_table[idx]
+            if self.is_legal_move(move[0], move[1], color):
+                moves.append(move)
+        return moves
 
     def random_move(self, color: str) -> Optional[Tuple[int, int]]:
         """
@@ -272,8 +595,18 @@ class GoBoard:
         Returns:
             Optional[Tuple[int, int]]: Coordinates of a random legal move, or None if no legal moves are available.
         """
-        legal_moves = self.get_legal_moves(color)
-        return random.choice(legal_moves) if legal_moves else None
+        # Shuffle the empty cells and take the first legal one: the first
+        # legal cell of a uniform permutation is uniform over the legal moves,
+        # so this matches choosing from the full legal list but usually stops
+        # after checking one or two cells instead of sweeping the whole board.
+        moves_table = self._moves
+        candidates = bits_to_indices(~(self.black_bb | self.white_bb) & self._full_mask)
+        random.shuffle(candidates)
+        for idx in candidates:
+            move = moves_table[idx]
+            if self.is_legal_move(move[0], move[1], color):
+                return move
+        return None
 
     def is_terminal(self, color):
         """
@@ -285,9 +618,15 @@ class GoBoard:
          Returns:
              bool: True if there are no legal moves left for either player, False otherwise.
          """
-        if len(self.get_legal_moves(color)) == 0:
-            return True
-        return False
+        moves_table = self._moves
+        empties = ~(self.black_bb | self.white_bb) & self._full_mask
+        while empties:
+            lsb = empties & -empties
+            empties ^= lsb
+            x, y = moves_table[lsb.bit_length() - 1]
+            if self.is_legal_move(x, y, color):
+                return False
+        return True
 
     def evaluate_board(self, color: str) -> float:
         """
@@ -299,15 +638,15 @@ class GoBoard:
          Returns:
              float: The evaluation score, which is the difference between the scores of the player and the opponent.
          """
-        opponent_color = self.opponent_color(color)
-        return self.count_score()[color] - self.count_score()[opponent_color]
+        scores = self.count_score()
+        return scores[color] - scores[self.opponent_color(color)]
 
     def get_state(self):
         """
         Returns the current state of the board.
 
         Returns:
-            list: The current board configuration.
+            bytearray: The current board buffer.
         """
         return self.board
 
@@ -321,7 +660,11 @@ class GoBoard:
         Returns:
             int: The number of stones of the specified color on the board.
         """
-        return sum(row.count(color) for row in self.board)
+        # The color bitboards are kept current by every placement and capture,
+        # so the count is a popcount of the running state rather than a scan
+        # of the board buffer.
+        bb = self.black_bb if color == 'BLACK' else self.white_bb
+        return bin(bb).count('1')
 
     def controlled_territory(self, color: str) -> int:
         """
@@ -334,42 +677,17 @@ class GoBoard:
           Returns:
               int: The score of the controlled territory for the given color.
           """
-        visited = set()
-        territory_score = 0
-
-        def flood_fill(x: int, y: int) -> Set[Tuple[int, int]]:
-            """
-               Perform a flood fill to find all connected empty spaces.
-
-               Args:
-                   x (int): The x-coordinate of the starting point.
-                   y (int): The y-coordinate of the starting point.
-
-               Returns:
-                   Set[Tuple[int, int]]: A set of coordinates representing the empty spaces.
-               """
-            stack = [(x, y)]
-            group = set()
-            while stack:
-                cx, cy = stack.pop()
-                if (cx, cy) in group or (cx, cy) in visited:
-                    continue
-                group.add((cx, cy))
-                visited.add((cx, cy))
-                if self.board[cx][cy] is None:  # Changed from '.' to None
-                    for nx, ny in self.get_neighbors(cx, cy):
-                        if (nx, ny) not in visited:
-                            stack.append((nx, ny))
-            return group
-
-        for x in range(self.size):
-            for y in range(self.size):
-                if self.board[x][y] is None and (x, y) not in visited:  # Changed from '.' to None
-                    empty_group = flood_fill(x, y)
-                    if self.is_surrounded(empty_group, color):
-                        territory_score += len(empty_group)
-
-        return territory_score
+        # The flood traversal is the same for both colors (the color only
+        # affects the surround check), so one fused kernel pass produces both
+        # totals; the pair is cached against the current Zobrist hash because
+        # the heuristics ask for both colors of the same position in a row.
+        cache = self._territory_cache
+        if cache is None or cache[0] != self.zobrist_hash:
+            cells = np.frombuffer(self.board, dtype=np.uint8)
+            black_territory, white_territory = surrounded_territories(cells, self.size)
+            cache = (self.zobrist_hash, int(black_territory), int(white_territory))
+            self._territory_cache = cache
+        return cache[1] if color == 'BLACK' else cache[2]
 
     def get_captures(self, color: str) -> int:
         """
@@ -394,38 +712,15 @@ class GoBoard:
           Returns:
               int: The number of potential liberties for the given color.
           """
-        visited = set()
-        liberty_count = 0
-
-        def count_liberties(x: int, y: int):
-            """
-            Count the number of liberties for a group of stones.
-
-            Args:
-                x (int): The x-coordinate of the starting point.
-                y (int): The y-coordinate of the starting point.
-            """
-            nonlocal liberty_count  # Declare that we are using the outer variable
-            stack = [(x, y)]
-            while stack:
-                cx, cy = stack.pop()
-                if (cx, cy) in visited:
-                    continue
-                visited.add((cx, cy))
-                if self.board[cx][cy] == color:
-                    for nx, ny in self.get_neighbors(cx, cy):
-                        if self.board[nx][ny] is None:  # Changed from '.' to None
-                            liberty_count += 1
-                        elif self.board[nx][ny] != color:
-                            continue
-                        stack.append((nx, ny))
-
-        for x in range(self.size):
-            for y in range(self.size):
-                if self.board[x][y] == color and (x, y) not in visited:
-                    count_liberties(x, y)
-
-        return liberty_count
+        stones = self.black_bb if color == 'BLACK' else self.white_bb
+        empty = self._full_mask & ~(self.black_bb | self.white_bb)
+        # The traversal this replaces counted every adjacent (own stone, empty
+        # cell) pair once, so four shifted intersections and their popcounts
+        # give the identical total.
+        return (bin((stones << self.size) & empty).count('1')
+                + bin((stones >> self.size) & empty).count('1')
+                + bin((stones << 1) & self._not_first_col & empty).count('1')
+                + bin((stones >> 1) & self._not_last_col & empty).count('1'))
 
     def corner_and_edge_control(self, color: str) -> int:
         """
@@ -437,14 +732,8 @@ class GoBoard:
         Returns:
             int: The score based on control over corners and edges.
         """
-        score = 0
-        for x in range(self.size):
-            for y in range(self.size):
-                if self.board[x][y] == color:
-                    if (x in [0, self.size - 1] and y in [0, self.size - 1]) or \
-                            (x in [0, self.size - 1] or y in [0, self.size - 1]):
-                        score += 1  # Additional points for controlling corners and edges
-        return score
+        stones = self.black_bb if color == 'BLACK' else self.white_bb
+        return bin(stones & self._border_mask).count('1')
 
     def evaluate_board_using_heuristic(self, color: str) -> int:
         """
@@ -493,7 +782,7 @@ class GoBoard:
         Returns:
             str: The opponent's color.
         """
-        return 'WHITE' if color == 'BLACK' else 'BLACK'
+        return OPPONENT[color]
 
     def count_score(self) -> Dict[str, int]:
         """
@@ -504,43 +793,17 @@ class GoBoard:
         Returns:
             Dict[str, int]: A dictionary with scores for 'BLACK' and 'WHITE'.
         """
-
-        def count_area(color: str) -> int:
-            """
-            Count the number of empty spaces surrounded by the given color.
-            """
-            visited = set()
-            score = 0
-
-            def flood_fill(x: int, y: int) -> Set[Tuple[int, int]]:
-                """
-                Perform a flood fill to find all connected empty spaces.
-                """
-                stack = [(x, y)]
-                group = set()
-                while stack:
-                    cx, cy = stack.pop()
-                    if (cx, cy) in group or (cx, cy) in visited:
-                        continue
-                    group.add((cx, cy))
-                    visited.add((cx, cy))
-                    for nx, ny in self.get_neighbors(cx, cy):
-                        if self.board[nx][ny] is None and (nx, ny) not in group:
-                            stack.append((nx, ny))
-                return group
-
-            for x in range(self.size):
-                for y in range(self.size):
-                    if self.board[x][y] is None and (x, y) not in visited:
-                        empty_group = flood_fill(x, y)
-                        if self.is_surrounded(empty_group, color):
-                            score += len(empty_group)
-
-            return score
-
-        black_score = count_area('BLACK') + self.captured['WHITE']
-        white_score = count_area('WHITE') + self.captured['BLACK']
-        return {'BLACK': black_score, 'WHITE': white_score}
+        # The enclosed areas are a pure function of the position, so one fused
+        # kernel pass produces both colors' totals and is cached against the
+        # current Zobrist hash; only the capture counters are added per call.
+        cache = self._areas_cache
+        if cache is None or cache[0] != self.zobrist_hash:
+            cells = np.frombuffer(self.board, dtype=np.uint8)
+            black_area, white_area = enclosed_areas(cells, self.size)
+            cache = (self.zobrist_hash, int(black_area), int(white_area))
+            self._areas_cache = cache
+        return {'BLACK': cache[1] + self.captured['WHITE'],
+                'WHITE': cache[2] + self.captured['BLACK']}
 
     def null_heuristic(self, color: str) -> int:
         """
@@ -556,12 +819,38 @@ class GoBoard:
 
     def copy(self):
         """
-         Create a deep copy of the current GoBoard instance.
+         Create a fast copy of the current GoBoard instance.
+
+         Only the minimal state is duplicated: the board buffer, the captured counters
+         and the last captured groups. previous_boards is shared with the original
+         (ko history is common to the whole game) and history starts empty, since
+         search-tree copies never undo past their creation point.
 
          Returns:
              GoBoard: A new GoBoard instance with the same board configuration.
          """
-        # Create a deep copy of the GoBoard instance
-        new_board = GoBoard(self.size, self.previous_boards)
-        new_board.board = deepcopy(self.board)
+        new_board = GoBoard.__new__(GoBoard)
+        new_board.size = self.size
+        new_board.board = self.board[:]
+        new_board.captured = self.captured.copy()
+        new_board.previous_boards = self.previous_boards
+        new_board.last_captured = self.last_captured.copy()
+        new_board.history = []
+        new_board.zobrist = self.zobrist
+        new_board.zobrist_hash = self.zobrist_hash
+        new_board._scratch = np.empty(self.size * self.size, np.int32)
+        new_board._full_mask = self._full_mask
+        new_board._not_first_col = self._not_first_col
+        new_board._not_last_col = self._not_last_col
+        new_board._neighbors = self._neighbors
+        new_board._neighbor_coords = self._neighbor_coords
+        new_board._border_mask = self._border_mask
+        new_board._moves = self._moves
+        new_board.black_bb = self.black_bb
+        new_board.white_bb = self.white_bb
+        new_board.groups = dict(self.groups)
+        new_board.group_index = self.group_index[:]
+        new_board._areas_cache = self._areas_cache
+        new_board._territory_cache = self._territory_cache
+        new_board._last_capture = 0
         return new_board
@@ -1,15 +1,57 @@
 import math
+import multiprocessing
+import random
 from typing import Optional, Tuple, Dict
 
+import numpy as np
+
 import Agents
 from Expectimax import Expectimax
 from Minimax import Minimax
 
-from GoBoard import GoBoard
+from GoBoard import GoBoard, COLOR_CODES, EMPTY, OPPONENT
 
 from Agents import RandomAgent, GreedyAgent
 
 
+def _root_search(args):
+    """
+    Worker for mcts_search_parallel: run an independent sequential search in a
+    separate process and return the root children's (visits, value) totals.
+    Each worker seeds its own RNG so the trees explore different rollouts.
+    """
+    board, color, agent_white, iterations, exploration_weight, seed = args
+    random.seed(seed)
+    searcher = MCTS(board, color, agent_white, iterations, exploration_weight)
+    root = MCTSNode(board, color)
+    for _ in range(iterations):
+        node = searcher._select(root)
+        reward = searcher._simulate(node)
+        searcher._backpropagate(node, reward)
+    return {move: (child.visits, child.value) for move, child in root.children.items()}
+
+
+def _capture_priority(board: GoBoard, move: Tuple[int, int], color: str) -> int:
+    """
+    Fast expansion prior for a move: the number of adjacent opponent groups
+    down to their last liberty, read from the board's group records.
+    """
+    x, y = move
+    idx = x * board.size + y
+    code = COLOR_CODES[color]
+    count = 0
+    seen = set()
+    for ni in board.neighbors_of(idx):
+        neighbor_color = board.board[ni]
+        if neighbor_color != EMPTY and neighbor_color != code:
+            group_id = board.group_index[ni]
+            if group_id not in seen:
+                seen.add(group_id)
+                if bin(board.groups[group_id][1]).count('1') == 1:
+                    count += 1
+    return count
+
+
 class MCTSNode:
     """
      A class representing a node in the Monte Carlo Tree Search (MCTS).
@@ -39,6 +81,42 @@ class MCTSNode:
         self.children: Dict[Tuple[int, int], 'MCTSNode'] = {}
         self.visits = 0
         self.value = 0
+        self._legal = None
+        # Children in insertion order, kept alongside the dict so selection
+        # can scan an existing list instead of materializing one per call.
+        self._child_list = []
+
+    def legal_moves(self):
+        """
+        Return the legal moves for this node's color, computed once and cached.
+        The node's board is never mutated after expansion copies it, so the
+        list stays valid for the node's lifetime; selection, expansion and the
+        terminal check all reuse it instead of re-running the legality sweep.
+
+        Returns:
+        --------
+        List[Tuple[int, int]]:
+            The legal moves available from this node's position.
+        """
+        if self._legal is None:
+            moves = self.board.get_legal_moves(self.color)
+            # Capture threats first, remaining moves in board-scan order, so
+            # progressive widening expands the most forcing moves first.
+            moves.sort(key=lambda move: -_capture_priority(self.board, move, self.color))
+            self._legal = moves
+        return self._legal
+
+    def is_terminal(self) -> bool:
+        """
+        Check whether this node's position has no legal moves left, using the
+        cached move list.
+
+        Returns:
+        --------
+        bool:
+            True if no legal moves are available from this node.
+        """
+        return len(self.legal_moves()) == 0
 
     def is_fully_expanded(self) -> bool:
         """
@@ -49,8 +127,7 @@ class MCTSNode:
          bool:
              True if all legal moves have corresponding child nodes, False otherwise.
          """
-        legal_moves = self.board.get_legal_moves(self.color)
-        return len(self.children) == len(legal_moves)
+        return len(self.children) == len(self.legal_moves())
 
     def best_child(self, exploration_weight: float) -> Optional['MCTSNode']:
         """
@@ -69,27 +146,21 @@ class MCTSNode:
         if not self.children:
             return None
 
-        # self.children is a dict, so self.children.values() is an array of MCTSNodes
-        return max(self.children.values(), key=lambda child: child.uct_score(exploration_weight))
-
-    def uct_score(self, exploration_weight: float) -> float:
-        """
-        Calculate the UCT score for the node.
-
-        Parameters:
-        -----------
-        exploration_weight : float
-            The exploration weight for the UCT formula.
-
-        Returns:
-        --------
-        float:
-            The UCT score.
-        """
-        if self.visits == 0:
-            return float('inf')
-        parent_visits = self.parent.visits if self.parent else 1
-        return (self.value / self.visits) + exploration_weight * math.sqrt(math.log(parent_visits) / self.visits)
+        # The children's statistics are gathered into parallel arrays and the
+        # UCT formula evaluated as a handful of vector operations, so the
+        # per-child work is a C loop instead of Python float math. The log of
+        # this node's visit count is computed once per selection; an unvisited
+        # child scores infinity, so it is returned directly.
+        children = self._child_list
+        count = len(children)
+        visits = np.fromiter((child.visits for child in children), dtype=np.float64, count=count)
+        zero = np.flatnonzero(visits == 0)
+        if zero.size:
+            return children[int(zero[0])]
+        values = np.fromiter((child.value for child in children), dtype=np.float64, count=count)
+        log_visits = math.log(self.visits) if self.visits > 0 else 0.0
+        scores = values / visits + exploration_weight * np.sqrt(log_visits / visits)
+        return children[int(np.argmax(scores))]
 
 
 class MCTS:
@@ -117,6 +188,26 @@ class MCTS:
         self.iterations = mcts_iterations
         self.exploration_weight = exploration_weight
         self.agent_white = agent_white
+        # Transposition table: positions reached through different move orders
+        # share one node (keyed by Zobrist hash plus player to move), so their
+        # visit counts and values accumulate instead of being split between
+        # duplicates. Each node keeps its first parent for backpropagation,
+        # which also prevents cycles through a shared ancestor.
+        self.tt: Dict[Tuple[int, str], MCTSNode] = {}
+        # Rollout scores keyed by the final position's Zobrist hash: rollouts
+        # often end in the same late-game positions, and the heuristic they
+        # are scored with is a pure function of the position.
+        self._score_cache: Dict[int, float] = {}
+
+    # Progressive-widening coefficient: a node with v visits may have at most
+    # ceil(_WIDENING_C * sqrt(v + 1)) children.
+    _WIDENING_C = 1.0
+    _SCORE_CACHE_LIMIT = 100000
+    # Rollout early termination: every _EARLY_CHECK_PLIES plies the heuristic
+    # gap between the colors is checked, and the rollout stops once it exceeds
+    # _EARLY_TERMINATION_GAP — the position is already decided.
+    _EARLY_CHECK_PLIES = 5
+    _EARLY_TERMINATION_GAP = 15
 
     def mcts_search(self) -> Optional[Tuple[int, int]]:
         """
@@ -134,8 +225,44 @@ class MCTS:
             reward = self._simulate(node)
             self._backpropagate(node, reward)
 
-        best_node = root.best_child(0)
-        return best_node.move if best_node else None
+        if not root.children:
+            return None
+        # The move is read off the root's edge dictionary, not the chosen
+        # node's .move: a transposition-shared node keeps the move from its
+        # first creation site, which may belong to a different parent.
+        best_move, _ = max(root.children.items(), key=lambda item: item[1].visits)
+        return best_move
+
+    def mcts_search_parallel(self, processes: Optional[int] = None) -> Optional[Tuple[int, int]]:
+        """
+        Root-parallel MCTS: each worker process grows an independent tree from
+        the current position with a share of the iteration budget, and the
+        workers' root statistics are merged by summing visit counts per move.
+
+        Parameters:
+        -----------
+        processes : Optional[int]
+            The number of worker processes (defaults to the CPU count).
+
+        Returns:
+        --------
+        Optional[Tuple[int, int]]:
+            The move with the highest combined visit count, or None if no
+            worker expanded any move.
+        """
+        workers = processes if processes is not None else multiprocessing.cpu_count()
+        per_worker = max(1, self.iterations // workers)
+        args = [(self.board, self.color, self.agent_white, per_worker,
+                 self.exploration_weight, random.randrange(2 ** 32))
+                for _ in range(workers)]
+        totals: Dict[Tuple[int, int], int] = {}
+        with multiprocessing.Pool(processes) as pool:
+            for stats in pool.imap_unordered(_root_search, args):
+                for move, (visits, _) in stats.items():
+                    totals[move] = totals.get(move, 0) + visits
+        if not totals:
+            return None
+        return max(totals, key=totals.get)
 
     def _select(self, node: MCTSNode) -> MCTSNode:
         """
@@ -151,11 +278,24 @@ class MCTS:
           MCTSNode:
               The selected node.
           """
-        while not node.board.is_terminal(node.color):
-            if not node.is_fully_expanded():
+        # Transposition sharing turns the tree into a graph: positions that
+        # repeat through a ko-like sequence link to each other, so the descent
+        # tracks the nodes it has passed through and stops at the first
+        # repeat instead of cycling forever.
+        seen = {id(node)}
+        while not node.is_terminal():
+            # Progressive widening: only ceil(sqrt(visits + 1)) children may
+            # exist at a node, so expansion effort follows the nodes the
+            # search actually revisits instead of fanning out every legal
+            # move at depth one.
+            limit = min(len(node.legal_moves()),
+                        max(1, math.ceil(self._WIDENING_C * math.sqrt(node.visits + 1))))
+            if len(node.children) < limit:
                 return self._expand(node)
-            else:
-                node = node.best_child(self.exploration_weight)
+            node = node.best_child(self.exploration_weight)
+            if id(node) in seen:
+                return node
+            seen.add(id(node))
         return node
 
     def _expand(self, node: MCTSNode) -> MCTSNode:
@@ -172,14 +312,18 @@ class MCTS:
         MCTSNode:
             The newly created child node.
         """
-        legal_moves = node.board.get_legal_moves(node.color)
-        for move in legal_moves:
+        for move in node.legal_moves():
             if move not in node.children:
                 new_board = node.board.copy()
                 new_board.play_move(*move, node.color)
-                child_color = 'WHITE' if node.color == 'BLACK' else 'BLACK'
-                child_node = MCTSNode(new_board, child_color, move, node)
+                child_color = OPPONENT[node.color]
+                key = (new_board.zobrist_hash, child_color)
+                child_node = self.tt.get(key)
+                if child_node is None:
+                    child_node = MCTSNode(new_board, child_color, move, node)
+                    self.tt[key] = child_node
                 node.children[move] = child_node
+                node._child_list.append(child_node)
                 return child_node
         return node.best_child(self.exploration_weight)
 
@@ -209,10 +353,22 @@ class MCTS:
                 move = self.agent_white.getAction(board_copy)
             if move:
                 board_copy.play_move(*move, current_color)
-                current_color = 'WHITE' if current_color == 'BLACK' else 'BLACK'
+                current_color = OPPONENT[current_color]
                 i += 1
-
-        return board_copy.evaluate_board_using_heuristic("BLACK")
+                if i % self._EARLY_CHECK_PLIES == 0:
+                    gap = (board_copy.evaluate_board_using_heuristic('BLACK')
+                           - board_copy.evaluate_board_using_heuristic('WHITE'))
+                    if abs(gap) > self._EARLY_TERMINATION_GAP:
+                        break
+
+        board_hash = board_copy.zobrist_hash
+        reward = self._score_cache.get(board_hash)
+        if reward is None:
+            reward = board_copy.evaluate_board_using_heuristic("BLACK")
+            if len(self._score_cache) >= self._SCORE_CACHE_LIMIT:
+                self._score_cache.pop(next(iter(self._score_cache)))
+            self._score_cache[board_hash] = reward
+        return reward
 
 
     def _backpropagate(self, node: MCTSNode, reward: float):
@@ -15,12 +15,14 @@ class Minimax:
         best_value = -float('inf')
 
         for move in self.board.get_legal_moves(self.color):
-            board_copy = self.board.copy()
-            board_copy.play_move(*move, self.color)
-            move_value = self._minimax_search(board_copy, self.board.opponent_color(self.color), depth - 1, False)
-            if move_value > best_value:
-                best_value = move_value
-                best_move = move
+            # Play on the shared board and undo afterwards instead of copying
+            # a board per move.
+            if self.board.play_move(*move, self.color, record_history=True):
+                move_value = self._minimax_search(self.board, self.board.opponent_color(self.color), depth - 1, False)
+                self.board.undo_move()
+                if move_value > best_value:
+                    best_value = move_value
+                    best_move = move
 
         return best_move, best_value
 
@@ -47,19 +49,19 @@ class Minimax:
         if maximizing:
             best_value = -float('inf')
             for move in moves:
-                board_copy = board.copy()
-                board_copy.play_move(*move, color)
-                value = self._minimax_search(board_copy, board.opponent_color(color), depth - 1, False)
-                best_value = max(best_value, value)
+                if board.play_move(*move, color, record_history=True):
+                    value = self._minimax_search(board, board.opponent_color(color), depth - 1, False)
+                    board.undo_move()
+                    best_value = max(best_value, value)
             self.memo[(board_key, color, depth)] = best_value
             return best_value
         else:
             best_value = float('inf')
             for move in moves:
-                board_copy = board.copy()
-                board_copy.play_move(*move, color)
-                value = self._minimax_search(board_copy, board.opponent_color(color), depth - 1, True)
-                best_value = min(best_value, value)
+                if board.play_move(*move, color, record_history=True):
+                    value = self._minimax_search(board, board.opponent_color(color), depth - 1, True)
+                    board.undo_move()
+                    best_value = min(best_value, value)
             self.memo[(board_key, color, depth)] = best_value
             return best_value
 
@@ -1,10 +1,14 @@
 import random
-from typing import Tuple, Optional, Dict
+from typing import Tuple, Optional, Dict, List
 
 import GoBoard
 
 OPPONENT_COLOR = {"BLACK": "WHITE", "WHITE": "BLACK"}
 
+# Transposition entry flags: a value finished inside the window is exact, one
+# produced by a cutoff is only a lower/upper bound on the true value.
+EXACT, LOWER, UPPER = 0, 1, 2
+
 
 class MinimaxAlphaBeta:
     """
@@ -23,7 +27,14 @@ class MinimaxAlphaBeta:
         """
         self.board = board
         self.color = color
-        self.memo: Dict[str, float] = {}  # Memoization dictionary
+        # Transposition table keyed by (zobrist_hash, color), each entry a
+        # (value, depth, flag) triple; kept on the instance so successive root
+        # searches reuse earlier results.
+        self.memo: Dict[Tuple[int, str], Tuple[float, int, int]] = {}
+        # Move-ordering state: the last two cutoff moves per depth (killers)
+        # and a cumulative per-move cutoff score (history heuristic).
+        self.killers: Dict[int, List[Optional[Tuple[int, int]]]] = {}
+        self.history: Dict[Tuple[int, int], int] = {}
 
     def minimax(self, depth: int) -> Tuple[Optional[Tuple[int, int]], float]:
         """
@@ -42,16 +53,52 @@ class MinimaxAlphaBeta:
         beta = float('inf')
 
         for move in self.board.get_legal_moves(self.color):
-            board_copy = self.board.copy()
-            board_copy.play_move(*move, self.color)
-            move_value = self._minimax_search(board_copy, self.board.opponent_color(self.color), depth - 1, alpha, beta,
-                                              False)
-            if move_value > alpha:
-                alpha = move_value
-                best_move = move
+            # Play on the shared board and undo afterwards instead of copying
+            # a board per move.
+            if self.board.play_move(*move, self.color, record_history=True):
+                move_value = self._minimax_search(self.board, self.board.opponent_color(self.color), depth - 1, alpha,
+                                                  beta, False)
+                self.board.undo_move()
+                if move_value > alpha:
+                    alpha = move_value
+                    best_move = move
 
         return best_move, alpha
 
+    def iterative_minimax(self, max_depth: int) -> Tuple[Optional[Tuple[int, int]], float]:
+        """
+        Run the search at increasing depths 1..max_depth, reordering the root
+        moves by the previous depth's scores before each deeper pass. The
+        transposition table, killers and history persist across iterations, so
+        the final full-depth pass starts with near-optimal ordering.
+
+        Args:
+            max_depth (int): The deepest level to search to.
+
+        Returns:
+            Tuple[Optional[Tuple[int, int]], float]: The best move found at
+                                                     max_depth and its value.
+        """
+        moves = self.board.get_legal_moves(self.color)
+        opponent = self.board.opponent_color(self.color)
+        best_move, best_value = None, -float('inf')
+        for depth in range(1, max_depth + 1):
+            alpha = -float('inf')
+            best_move = None
+            scores = {}
+            for move in moves:
+                if self.board.play_move(*move, self.color, record_history=True):
+                    value = self._minimax_search(self.board, opponent, depth - 1, alpha, float('inf'), False)
+                    self.board.undo_move()
+                    scores[move] = value
+                    if value > alpha:
+                        alpha = value
+                        best_move = move
+            best_value = alpha
+            # Stable sort: equal scores keep this pass's order.
+            moves.sort(key=lambda move: -scores[move])
+        return best_move, best_value
+
     def _minimax_search(self, board: 'GoBoard', color: str, depth: int, alpha: float, beta: float,
                         maximizing: bool) -> float:
         """
@@ -69,11 +116,24 @@ class MinimaxAlphaBeta:
         Returns:
             float: The value of the best move at the current depth.
         """
-        board_key = self._board_to_key(board.board)
-
-        # Return cached result if this board state has already been evaluated
-        if (board_key, color, depth) in self.memo:
-            return self.memo[(board_key, color, depth)]
+        # The board maintains its Zobrist hash incrementally, so the memo key
+        # is a single int instead of an O(N^2) string render of the position.
+        key = (board.zobrist_hash, color)
+
+        # Probe the table: an entry searched at least this deep can be
+        # returned directly when exact, or used to tighten the window when it
+        # is only a bound from an earlier cutoff.
+        entry = self.memo.get(key)
+        if entry is not None and entry[1] >= depth:
+            cached_value, _, cached_flag = entry
+            if cached_flag == EXACT:
+                return cached_value
+            if cached_flag == LOWER:
+                alpha = max(alpha, cached_value)
+            else:
+                beta = min(beta, cached_value)
+            if alpha >= beta:
+                return cached_value
 
         if depth == 0:
             value = board.evaluate_board_using_heuristic(color) - board.evaluate_board_using_heuristic(
@@ -81,7 +141,7 @@ class MinimaxAlphaBeta:
             # value = board.evaluate_board_using_heuristic(color)
             # value = board.evaluate_board_using_heuristic_for_minimax(color)
             # value = board.evaluate_board(color)
-            self.memo[(board_key, color, depth)] = value
+            self._memo_store(key, value, depth, EXACT)
             return value
 
         moves = board.get_legal_moves(color)
@@ -91,43 +151,92 @@ class MinimaxAlphaBeta:
             # value = board.evaluate_board_using_heuristic(color)
             # value = board.evaluate_board_using_heuristic_for_minimax(color)
             # value = board.evaluate_board(color)
-            self.memo[(board_key, color, depth)] = value
+            self._memo_store(key, value, depth, EXACT)
             return value
+
+        alpha_orig, beta_orig = alpha, beta
+        self._order_moves(moves, depth)
         # Maximizing player (trying to maximize score)
         if maximizing:
             best_value = -float('inf')
             for move in moves:
-                board_copy = board.copy()
-                board_copy.play_move(*move, color)
-                value = self._minimax_search(board_copy, board.opponent_color(color), depth - 1, alpha, beta, False)
-                best_value = max(best_value, value)
-                alpha = max(alpha, value)
-                if beta <= alpha:
-                    break  # Beta cut-off
-            self.memo[(board_key, color, depth)] = best_value
-            return best_value
+                if board.play_move(*move, color, record_history=True):
+                    value = self._minimax_search(board, board.opponent_color(color), depth - 1, alpha, beta, False)
+                    board.undo_move()
+                    best_value = max(best_value, value)
+                    alpha = max(alpha, value)
+                    if beta <= alpha:
+                        self._record_cutoff(move, depth)
+                        break  # Beta cut-off
         # Minimizing player (trying to minimize score)
         else:
             best_value = float('inf')
             for move in moves:
-                board_copy = board.copy()
-                board_copy.play_move(*move, color)
-                value = self._minimax_search(board_copy, board.opponent_color(color), depth - 1, alpha, beta, True)
-                best_value = min(best_value, value)
-                beta = min(beta, value)
-                if beta <= alpha:
-                    break  # Alpha cut-off
-            self.memo[(board_key, color, depth)] = best_value
-            return best_value
-
-    def _board_to_key(self, board: 'GoBoard') -> str:
+                if board.play_move(*move, color, record_history=True):
+                    value = self._minimax_search(board, board.opponent_color(color), depth - 1, alpha, beta, True)
+                    board.undo_move()
+                    best_value = min(best_value, value)
+                    beta = min(beta, value)
+                    if beta <= alpha:
+                        self._record_cutoff(move, depth)
+                        break  # Alpha cut-off
+
+        # Classify the result against the original window: a cutoff value is
+        # stored as the bound it proves, not as the exact node value.
+        if best_value <= alpha_orig:
+            flag = UPPER
+        elif best_value >= beta_orig:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self._memo_store(key, best_value, depth, flag)
+        return best_value
+
+    def _memo_store(self, key: Tuple[int, str], value: float, depth: int, flag: int):
         """
-         Convert the board state to a unique key for memoization.
+        Store a search result, keeping whichever entry for this position was
+        searched deeper.
 
-         Args:
-             board (GoBoard): The current state of the game board.
+        Args:
+            key (Tuple[int, str]): The (zobrist_hash, color) table key.
+            value (float): The value (or bound) computed for the position.
+            depth (int): The remaining search depth the value was computed at.
+            flag (int): EXACT, LOWER or UPPER classification of the value.
+        """
+        entry = self.memo.get(key)
+        if entry is None or depth >= entry[1]:
+            self.memo[key] = (value, depth, flag)
+
+    def _order_moves(self, moves: List[Tuple[int, int]], depth: int):
+        """
+        Sort moves in place so likely cutoffs come first: this depth's killer
+        moves, then moves by descending history score, then board-scan order.
+
+        Args:
+            moves (List[Tuple[int, int]]): The legal moves to reorder.
+            depth (int): The remaining search depth, used to select killers.
+        """
+        killers = self.killers.get(depth)
+        history = self.history
+        if killers is None:
+            if history:
+                moves.sort(key=lambda move: -history.get(move, 0))
+        else:
+            moves.sort(key=lambda move: (move not in killers, -history.get(move, 0)))
+
+    def _record_cutoff(self, move: Tuple[int, int], depth: int):
+        """
+        Remember a move that caused a cutoff: shift it into this depth's
+        killer slots and add depth*depth to its history score.
 
-         Returns:
-             str: A unique string representation of the board state.
-         """
-        return str(board)
+        Args:
+            move (Tuple[int, int]): The move that produced the cutoff.
+            depth (int): The remaining search depth where the cutoff happened.
+        """
+        killers = self.killers.get(depth)
+        if killers is None:
+            self.killers[depth] = [move, None]
+        elif killers[0] != move:
+            killers[1] = killers[0]
+            killers[0] = move
+        self.history[move] = self.history.get(move, 0) + depth * depth
@@ -1,6 +1,6 @@
 import numpy as np
 from typing import Tuple, Dict
-from GoBoard import GoBoard
+from GoBoard import GoBoard, COLOR_CODES, zobrist_table
 
 
 class QLearning:
@@ -21,7 +21,7 @@ class QLearning:
            The decay rate of the exploration probability.
        min_exploration_rate : float
            The minimum value of the exploration rate.
-       q_table : Dict[Tuple[Tuple[str, ...]], float]
+       q_table : Dict[Tuple[int, Tuple[int, int]], float]
            The Q-value table mapping state-action pairs to their Q-values.
        """
 
@@ -34,6 +34,31 @@ class QLearning:
         self.exploration_decay = exploration_decay
         self.min_exploration_rate = min_exploration_rate
         self.q_table = {}
+        # Uniform draws are taken from a refillable buffer generated in one
+        # PCG64 call, instead of crossing into the global legacy RNG once per
+        # decision.
+        self._rng = np.random.default_rng()
+        self._rand_buf = self._rng.random(self._RAND_BUF_SIZE)
+        self._rand_idx = 0
+
+    _RAND_BUF_SIZE = 4096
+
+    def _rand(self) -> float:
+        """
+        Return the next uniform draw from the buffered generator, refilling
+        the buffer when it runs out.
+
+        Returns:
+        --------
+        float:
+            A uniform random number in [0, 1).
+        """
+        idx = self._rand_idx
+        if idx == self._rand_buf.size:
+            self._rand_buf = self._rng.random(self._RAND_BUF_SIZE)
+            idx = 0
+        self._rand_idx = idx + 1
+        return self._rand_buf[idx]
 
     def get_q_value(self, board, action: Tuple[int, int]) -> float:
         """
@@ -52,23 +77,42 @@ class QLearning:
                The Q-value for the given state-action pair.
            """
         state = self.get_state(board)
-        if (state, action) in self.q_table:
-            return self.q_table[(state, action)]
-        else:
-            # Calculate heuristic evaluation for unseen board
-            copy_board = board.copy()
-            copy_board.play_move(*action, "BLACK")
-            return copy_board.evaluate_board_using_heuristic2("BLACK") - copy_board.evaluate_board_using_heuristic2(
-                "WHITE")
+        q = self.q_table.get((state, action))
+        return q if q is not None else self._heuristic_q(board, action)
+
+    def _heuristic_q(self, board, action: Tuple[int, int]) -> float:
+        """
+        Heuristic fallback value for a state-action pair that is not in the
+        Q-table, from simulating the action on a copy of the board.
+
+        Parameters:
+        -----------
+        board : GoBoard
+            The current state of the game board.
+        action : Tuple[int, int]
+            The action (move) to evaluate.
+
+        Returns:
+        --------
+        float:
+            The heuristic evaluation of the resulting position.
+        """
+        # Simulate the move in place and undo it afterwards instead of
+        # copying the board per candidate.
+        played = board.play_move(*action, "BLACK", record_history=True)
+        value = board.evaluate_board_using_heuristic2("BLACK") - board.evaluate_board_using_heuristic2("WHITE")
+        if played:
+            board.undo_move()
+        return value
 
-    def set_q_value(self, state: Tuple[Tuple[str, ...]], action: Tuple[int, int], value: float):
+    def set_q_value(self, state: int, action: Tuple[int, int], value: float):
         """
           Set the Q-value for a given board state and action.
 
           Parameters:
           -----------
-          state : Tuple[Tuple[str, ...]]
-              The state of the board.
+          state : int
+              The Zobrist state key of the board.
           action : Tuple[int, int]
               The action (move) to set the Q-value for.
           value : float
@@ -92,17 +136,24 @@ class QLearning:
         Tuple[int, int]:
             The chosen action (move).
         """
-        if np.random.rand() < self.exploration_rate:
+        if self._rand() < self.exploration_rate:
             return board.random_move(color)  # Explore: random move
         else:
             legal_moves = board.get_legal_moves(color)
             if not legal_moves:
                 return board.random_move(color)  # No legal moves: explore
-            q_values = [self.get_q_value(board, move) for move in legal_moves]
-            max_q = max(q_values, default=0.0)
-            best_moves = [move for move, q in zip(legal_moves, q_values) if q == max_q]
-            return best_moves[np.random.randint(len(best_moves))] if best_moves else board.random_move(
-                color)  # Exploit: best move
+            # The state key is the same for every candidate, so it is built
+            # once and the table probed directly; the board is only copied
+            # for moves that miss the table and need the heuristic fallback.
+            state = self.get_state(board)
+            q_table = self.q_table
+            q_values = [q_table.get((state, move)) for move in legal_moves]
+            q_arr = np.fromiter(
+                (q if q is not None else self._heuristic_q(board, move)
+                 for q, move in zip(q_values, legal_moves)),
+                dtype=np.float64, count=len(legal_moves))
+            best_indices = np.flatnonzero(q_arr == q_arr.max())
+            return legal_moves[int(best_indices[int(self._rand() * best_indices.size)])]  # Exploit: best move
 
     def update_q_values(self, board: GoBoard, color: str, action: Tuple[int, int], reward: float, next_board):
         """
@@ -122,7 +173,12 @@ class QLearning:
             The state of the game board after the action.
         """
         legal_moves_for_next_board = next_board.get_legal_moves(color)
-        max_future_q = max([self.get_q_value(next_board, move) for move in legal_moves_for_next_board], default=0.0)
+        next_state = self.get_state(next_board)
+        q_table = self.q_table
+        max_future_q = max(
+            [q if q is not None else self._heuristic_q(next_board, move)
+             for move, q in ((move, q_table.get((next_state, move))) for move in legal_moves_for_next_board)],
+            default=0.0)
         current_q = self.get_q_value(board, action)
         new_q = (1 - self.learning_rate) * current_q + self.learning_rate * (
                     reward + self.discount_factor * max_future_q)
@@ -134,9 +190,9 @@ class QLearning:
              """
         self.exploration_rate = max(self.exploration_rate * self.exploration_decay, self.min_exploration_rate)
 
-    def get_state(self, board: GoBoard) -> Tuple[Tuple[str, ...]]:
+    def get_state(self, board: GoBoard) -> int:
         """
-        Convert the game board state into a tuple representation for use in Q-learning.
+        Convert the game board state into an immutable representation for use in Q-learning.
 
         Parameters:
         -----------
@@ -145,10 +201,36 @@ class QLearning:
 
         Returns:
         --------
-        Tuple[Tuple[str, ...]]:
-            The board state represented as a tuple of tuples.
+        int:
+            The board's incrementally maintained Zobrist hash: a single int
+            read instead of copying the board buffer per lookup.
+        """
+        return board.zobrist_hash
+
+    def _state_hash(self, state) -> int:
+        """
+        Recompute the Zobrist state key from a stored board representation,
+        for converting tables saved before hashes became the key: either raw
+        cell bytes or the original tuple-of-tuples of color strings.
+
+        Parameters:
+        -----------
+        state : bytes or tuple
+            The board cells as saved in an older table.
+
+        Returns:
+        --------
+        int:
+            The Zobrist hash of that position.
         """
-        return tuple(tuple(row) for row in board.board)
+        if not isinstance(state, (bytes, bytearray)):
+            state = [0 if value is None else COLOR_CODES[value] for row in state for value in row]
+        table = zobrist_table(self.size)
+        state_hash = 0
+        for idx, code in enumerate(state):
+            if code:
+                state_hash ^= table[idx][code]
+        return state_hash
 
     def get_reward(self, board: GoBoard, color: str) -> float:
         """
@@ -195,7 +277,17 @@ class QLearning:
            filename : str
                The path to the file where the Q-table will be saved.
            """
-        np.save(filename, self.q_table)
+        # The table is written as a flat structured array (state hash,
+        # action, q) instead of a pickled dict: the file is a plain binary
+        # record per entry, loadable through a memory map without unpickling
+        # Python objects.
+        dtype = np.dtype([('state', np.uint64),
+                          ('action', np.int8, (2,)),
+                          ('q', np.float64)])
+        table = np.empty(len(self.q_table), dtype=dtype)
+        for i, ((state, action), value) in enumerate(self.q_table.items()):
+            table[i] = (state, action, value)
+        np.save(filename, table)
         print(f"{filename} saved successfully")
 
     def load(self, filename: str):
@@ -207,5 +299,19 @@ class QLearning:
         filename : str
             The path to the file from which the Q-table will be loaded.
         """
-        self.q_table = np.load(filename, allow_pickle=True).item()
+        try:
+            table = np.load(filename, mmap_mode='r')
+        except ValueError:
+            # Older saves pickled the whole dict into a 0-d object array; its
+            # keys hold the board cells, which convert to state hashes.
+            legacy = np.load(filename, allow_pickle=True).item()
+            self.q_table = {
+                (self._state_hash(state), action): float(value)
+                for (state, action), value in legacy.items()
+            }
+        else:
+            self.q_table = {
+                (int(row['state']), (int(row['action'][0]), int(row['action'][1]))): float(row['q'])
+                for row in table
+            }
         print(f"{filename} load successfully")
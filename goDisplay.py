@@ -1,7 +1,7 @@
 import tkinter as tk
 from PIL import Image, ImageTk
 from typing import List, Dict
-from GoBoard import GoBoard
+from GoBoard import GoBoard, BLACK, WHITE
 
 class GoDisplay:
     """
@@ -43,6 +43,17 @@ class GoDisplay:
         # Draw the initial grid on the board
         self.draw_grid()
 
+        # Pre-create one hidden stone item per intersection, stacked above the
+        # background and grid. Refreshes reconfigure these items in place
+        # instead of deleting and recreating the whole canvas.
+        self._stone_items = []
+        for x in range(board_size):
+            for y in range(board_size):
+                item = self.canvas.create_image(30 + x * 60 - 20, 30 + y * 60 - 20, anchor='nw',
+                                                image=self.black_stone_photo, state='hidden')
+                self._stone_items.append(item)
+        self._last_cells = None
+
     def make_game_summary(self):
         """
              Creates a frame for displaying the game summary, including the score and results.
@@ -146,14 +157,14 @@ class GoDisplay:
            Args:
                board: The current state of the GoBoard object.
            """
-        self.canvas.delete("all")
-        self.canvas.create_image(0, 0, anchor='nw', image=self.board_photo)
-        self.draw_grid()
-        for x in range(self.board_size):
-            for y in range(self.board_size):
-                stone = board.board[x][y]
-                if stone:
-                    self.draw_stone(x, y, stone)
+        # The background and grid are permanent items; only intersections that
+        # changed since the last refresh get their stone item reconfigured.
+        cells = bytes(board.board)
+        last = self._last_cells
+        for idx in range(self.board_size * self.board_size):
+            if last is None or cells[idx] != last[idx]:
+                self.draw_stone(idx // self.board_size, idx % self.board_size, cells[idx])
+        self._last_cells = cells
 
         self.draw_captured_stones(board.captured['BLACK'], board.captured['WHITE'])
         for widget in self.game_summary.winfo_children():
@@ -161,20 +172,22 @@ class GoDisplay:
         results_str = self.get_score_summary()
         tk.Label(self.game_summary, text=results_str, font=("Arial",14), bg="white").pack(expand=True)
 
-    def draw_stone(self, x: int, y: int, color: str):
+    def draw_stone(self, x: int, y: int, color: int):
         """
          Draws a stone on the board at the specified coordinates.
 
          Args:
              x: The x-coordinate on the board.
              y: The y-coordinate on the board.
-             color: The color of the stone ('black' or 'white').
+             color: The color code of the cell (BLACK, WHITE or EMPTY to hide).
          """
-        x1, y1 = 30 + x * 60 - 20, 30 + y * 60 - 20
-        if color.lower() == 'black':
-            self.canvas.create_image(x1, y1, anchor='nw', image=self.black_stone_photo)
-        elif color.lower() == 'white':
-            self.canvas.create_image(x1, y1, anchor='nw', image=self.white_stone_photo)
+        item = self._stone_items[x * self.board_size + y]
+        if color == BLACK:
+            self.canvas.itemconfig(item, image=self.black_stone_photo, state='normal')
+        elif color == WHITE:
+            self.canvas.itemconfig(item, image=self.white_stone_photo, state='normal')
+        else:
+            self.canvas.itemconfig(item, state='hidden')
 
     def get_winner_name(self, result):
         """
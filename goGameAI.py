@@ -179,7 +179,7 @@ class GoGame:
         # Play the move and update the board
         x, y = move
         if self.board.play_actual_move(x, y, self.current_color):
-            self.previous_boards.add(tuple(map(tuple, self.board.board)))
+            self.previous_boards.add(self.board.zobrist_hash)
             self.current_color = 'WHITE' if self.current_color == 'BLACK' else 'BLACK'
             self.display.display_board(self.board)
 
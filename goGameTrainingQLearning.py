@@ -115,7 +115,7 @@ class GoGameTrainingQLearning:
                 self.qlearn_agent_white.update_q_values(self.prev_white_board, self.current_color, move, reward, curr_board)
                 self.prev_white_board = self.board.copy()
 
-            self.previous_boards.add(tuple(map(tuple, self.board.board)))
+            self.previous_boards.add(self.board.zobrist_hash)
             self.current_color = 'WHITE' if self.current_color == 'BLACK' else 'BLACK'
             self.display.display_board(self.board)
 